@@ -1,10 +1,13 @@
 import json
 from copy import copy
 from enum import Enum
-from typing import Union, List, Any
+from typing import Union, List, Any, Callable, Dict, Mapping, Optional
 
 from cedarpy import _internal
 
+PolicySet = _internal.PolicySet
+Entities = _internal.Entities
+
 
 def echo(s: str) -> str:
     return _internal.echo(s)
@@ -17,6 +20,7 @@ class Decision(Enum):
 
 
 class Diagnostics:
+    __slots__ = ('_diagnostics',)
 
     def __init__(self, diagnostics: dict) -> None:
         super().__init__()
@@ -33,21 +37,35 @@ class Diagnostics:
 
 
 class AuthzResult:
+    __slots__ = ('_authz_resp', '_decision', '_allowed', '_diagnostics')
+
     def __init__(self, authz_resp: dict) -> None:
+        """Make an AuthzResult from an authorization response.
+
+        :param authz_resp is the authorization response; its decision, if any, must name a Decision
+
+        :raises KeyError: if the response's decision is not the name of a Decision
+        """
         super().__init__()
         self._authz_resp = authz_resp
+        # resolve the decision once; results are read far more often than they are constructed
+        decision = self._authz_resp.get('decision', None)
+        self._decision: Optional[Decision] = Decision[decision] if decision is not None else None
+        # Decision members are singletons, so identity is a sufficient (and the cheapest) comparison
+        self._allowed: bool = self._decision is Decision.Allow
         self._diagnostics = Diagnostics(self._authz_resp.get('diagnostics', {}))
 
     @property
-    def decision(self) -> Decision:
-        return Decision[self._authz_resp['decision']]
+    def decision(self) -> Optional[Decision]:
+        """The Decision, or None if the response did not include a decision"""
+        return self._decision
 
     @property
     def allowed(self) -> bool:
-        return Decision.Allow == self.decision
+        return self._allowed
 
     @property
-    def correlation_id(self) -> Decision:
+    def correlation_id(self) -> Optional[str]:
         return self._authz_resp.get('correlation_id', None)
 
     @property
@@ -61,25 +79,52 @@ class AuthzResult:
     def __getitem__(self, __name: str) -> Any:
         return getattr(self, __name)
 
+    def _key(self) -> tuple:
+        # reasons are reported in no particular order, so compare them as a set
+        return self.decision, frozenset(self._diagnostics.reasons), tuple(self._diagnostics.errors)
+
+    def __eq__(self, other: object) -> bool:
+        """AuthzResults are equal when their decision and diagnostics are equal; the correlation_id and metrics
+        describe a particular evaluation and are not compared"""
+        if not isinstance(other, AuthzResult):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (f"AuthzResult(decision={self.decision}, reasons={sorted(self._diagnostics.reasons)}"
+                f", errors={self._diagnostics.errors})")
 
-def is_authorized(request: dict,
-                  policies: str,
-                  entities: Union[str, List[dict]],
+
+def is_authorized(request: Union[Mapping, bytes],
+                  policies: Union[str, PolicySet],
+                  entities: Union[str, bytes, List[dict], Entities],
                   schema: Union[str, dict, None] = None,
                   verbose: bool = False) -> AuthzResult:
     """Evaluate whether the request is authorized given the parameters.
 
     :param request is a Cedar-style request object containing a principal, action, resource, and (optional) context;
-    context may be a dict (preferred) or a string
-    :param policies is a str containing all the policies in the Cedar PolicySet
-    :param entities a list of entities or a json-formatted string containing the list of entities to
-    include in the evaluation
-    :param schema (optional) dictionary or json-formatted string containing the Cedar schema
+    context may be a dict (preferred) or a string.  request may be a dict or any other Mapping, e.g. a read-only
+    MappingProxyType, or the request serialized as UTF-8 encoded json bytes, which is evaluated without converting
+    the request object
+    :param policies is a str containing all the policies in the Cedar PolicySet or a PolicySet from parse_policies
+    :param entities a list of entities or a json-formatted string (or UTF-8 encoded bytes) containing the list of
+    entities to include in the evaluation, or Entities from load_entities
+    :param schema (optional) dictionary or json-formatted string containing the Cedar schema; Entities from
+    load_entities must have been loaded with the same schema, otherwise the result is a NoDecision with an error
     :param verbose (optional) boolean determining whether to enable verbose logging output within the library
 
     :returns an AuthzResult
+    :raises ValueError: if a serialized request cannot be parsed
 
     """
+    if isinstance(request, bytes):
+        entities, schema = _to_internal_entities_and_schema(entities, schema)
+        authz_result_str: str = _internal.is_authorized_packed(request, policies, entities, schema, verbose)
+        return _to_authz_results([authz_result_str])[0]
+
     return is_authorized_batch(requests=[request],
                                policies=policies,
                                entities=entities,
@@ -87,41 +132,74 @@ def is_authorized(request: dict,
                                verbose=verbose)[0]
 
 
-def is_authorized_batch(requests: List[dict],
-                        policies: str,
-                        entities: Union[str, List[dict]],
+def pack_requests(requests: List[Mapping]) -> bytes:
+    """Serialize a batch of requests into a single payload that is_authorized_batch can evaluate without
+    converting each request individually.  Pack a batch once when it will be evaluated many times.
+
+    :param requests is list of Cedar-style request objects containing a principal, action, resource, and (optional) context;
+    context may be a dict (preferred) or a string.  Request objects may be dicts or any other Mapping
+
+    :returns the packed requests
+    """
+    # json only serializes dicts, e.g. not a read-only MappingProxyType
+    return json.dumps([request if isinstance(request, dict) else dict(request) for request in requests]).encode('utf-8')
+
+
+def is_authorized_batch(requests: Union[List[Mapping], bytes],
+                        policies: Union[str, PolicySet],
+                        entities: Union[str, bytes, List[dict], Entities],
                         schema: Union[str, dict, None] = None,
-                        verbose: bool = False) -> List[AuthzResult]:
+                        verbose: bool = False,
+                        parallel: bool = False) -> List[AuthzResult]:
     """Evaluate whether a batch of requests are authorized given the other parameters.  Each request is evaluated
     independently and results in an AuthzResult per request.
 
     :param requests is list of Cedar-style request objects containing a principal, action, resource, and (optional) context;
-    context may be a dict (preferred) or a string
-    :param policies is a str containing all the policies in the Cedar PolicySet
-    :param entities a list of entities or a json-formatted string containing the list of entities to
-    include in the evaluation
-    :param schema (optional) dictionary or json-formatted string containing the Cedar schema
+    context may be a dict (preferred) or a string.  Request objects may be dicts or any other Mapping.  requests may
+    also be a batch packed with pack_requests
+    :param policies is a str containing all the policies in the Cedar PolicySet or a PolicySet from parse_policies
+    :param entities a list of entities or a json-formatted string (or UTF-8 encoded bytes) containing the list of
+    entities to include in the evaluation, or Entities from load_entities
+    :param schema (optional) dictionary or json-formatted string containing the Cedar schema; Entities from
+    load_entities must have been loaded with the same schema, otherwise each result is a NoDecision with an error
     :param verbose (optional) boolean determining whether to enable verbose logging output within the library
+    :param parallel (optional) boolean determining whether to evaluate requests in parallel on a pool of threads
+    (sized to the number of CPUs); useful for large batches
 
     :returns a list of AuthzResults, in same order as the requests
+    :raises ValueError: if packed requests cannot be parsed
 
     """
+    entities, schema = _to_internal_entities_and_schema(entities, schema)
+
+    if isinstance(requests, bytes):
+        authz_result_strs: List[str] = _internal.is_authorized_batch_packed(requests, policies, entities, schema,
+                                                                            verbose, parallel)
+        return _to_authz_results(authz_result_strs)
+
     requests_local = []
     for request in requests:
+        if not isinstance(request, dict):
+            # e.g. a read-only MappingProxyType; _internal only accepts dicts
+            request = dict(request)
         if "context" in request:
             context = request["context"]
-            if isinstance(context, dict):
-                # ok user provided context as a dictionary, lets flatten it for them
-                context_json_str = json.dumps(context)
-                request = copy(request)
-                request["context"] = context_json_str
-            elif context is None:
-                request = copy(request)
-                del request["context"]
+            normalize_request = _REQUEST_NORMALIZERS_BY_CONTEXT_TYPE.get(type(context), None)
+            if normalize_request is None:
+                # e.g. a subclass of dict
+                normalize_request = _request_with_dict_context if isinstance(context, dict) else _request_as_is
+            request = normalize_request(request)
 
         requests_local.append(request)
 
-    if isinstance(entities, str):
+    authz_result_strs: List[str] = _internal.is_authorized_batch(requests_local, policies, entities, schema, verbose,
+                                                                 parallel)
+    return _to_authz_results(authz_result_strs)
+
+
+def _to_internal_entities_and_schema(entities: Union[str, bytes, List[dict], Entities],
+                                     schema: Union[str, dict, None]) -> tuple:
+    if isinstance(entities, (str, bytes)):
         pass
     elif isinstance(entities, list):
         entities = json.dumps(entities)
@@ -132,7 +210,35 @@ def is_authorized_batch(requests: List[dict],
         elif isinstance(schema, dict):
             schema = json.dumps(schema)
 
-    authz_result_strs: List[str] = _internal.is_authorized_batch(requests_local, policies, entities, schema, verbose)
+    return entities, schema
+
+
+def _request_with_dict_context(request: dict) -> dict:
+    # ok user provided context as a dictionary, lets flatten it for them
+    request = copy(request)
+    request["context"] = json.dumps(request["context"])
+    return request
+
+
+def _request_without_context(request: dict) -> dict:
+    request = copy(request)
+    del request["context"]
+    return request
+
+
+def _request_as_is(request: dict) -> dict:
+    return request
+
+
+# normalizes a request for _internal by the exact type of its context, so the common types need only one lookup
+_REQUEST_NORMALIZERS_BY_CONTEXT_TYPE: Dict[type, Callable[[dict], dict]] = {
+    dict: _request_with_dict_context,
+    type(None): _request_without_context,
+    str: _request_as_is,
+}
+
+
+def _to_authz_results(authz_result_strs: List[str]) -> List[AuthzResult]:
     authz_result_objs: List[dict] = []
 
     for authz_result_str in authz_result_strs:
@@ -145,6 +251,56 @@ def is_authorized_batch(requests: List[dict],
     return authz_results
 
 
+def parse_policies(policies: str) -> PolicySet:
+    """Parse policies into a PolicySet that can be passed to is_authorized and is_authorized_batch in place of the
+    policies str.  Parse policies once when they will be used for many authorization requests.
+
+    :param policies is a str containing all the policies in the Cedar PolicySet
+
+    :returns the parsed PolicySet
+    :raises ValueError: if the input policies cannot be parsed
+    """
+    return _internal.PolicySet(policies)
+
+
+def slice_policies(policy_set: PolicySet, action: str) -> PolicySet:
+    """Make a PolicySet of only the policies that may apply to requests for an action, e.g. Action::"view".
+    Authorizing those requests against the slice yields the same results as the full policy set, with fewer
+    policies to evaluate.  Slice once when many requests are for the same action.
+
+    :param policy_set is a PolicySet from parse_policies
+    :param action is the Cedar entity uid of the action
+
+    :returns the sliced PolicySet; the policy_set itself if it contains templates
+    :raises ValueError: if action is not an entity uid
+    """
+    return policy_set.slice_for_action(action)
+
+
+def load_entities(entities: Union[str, bytes, List[dict]],
+                  schema: Union[str, dict, None] = None) -> Entities:
+    """Load entities into Entities that can be passed to is_authorized and is_authorized_batch in place of the
+    entities list.  Load entities once when they will be used for many authorization requests.
+
+    :param entities a list of entities or a json-formatted string (or UTF-8 encoded bytes) containing the list of
+    entities
+    :param schema (optional) dictionary or json-formatted string containing the Cedar schema the entities are
+    validated against; its action entities are included, so the Entities must be authorized with the same schema
+
+    :returns the loaded Entities
+    :raises ValueError: if the input entities cannot be parsed or do not conform to the schema
+    """
+    if isinstance(entities, bytes):
+        entities = entities.decode('utf-8')
+    elif isinstance(entities, list):
+        entities = json.dumps(entities)
+
+    if isinstance(schema, dict):
+        schema = json.dumps(schema)
+
+    return _internal.Entities(entities, schema)
+
+
 def format_policies(policies: str,
                     line_width: int = 80,
                     indent_width: int = 2) -> str:
@@ -1,12 +1,15 @@
 use std::collections::{HashMap, HashSet};
+use std::fmt;
 use std::str::FromStr;
+use std::sync::{Arc, Mutex, OnceLock};
 use std::time::Instant;
 
 use anyhow::{Context as _, Error, Result};
 use cedar_policy::*;
 use cedar_policy_formatter::{Config, policies_str_to_pretty};
 use pyo3::prelude::*;
-use serde::{Deserialize, Serialize};
+use rayon::prelude::*;
+use serde::{de, Deserialize, Serialize};
 use serde_json::json;
 
 /// Echo (return) the input string
@@ -56,6 +59,135 @@ fn policies_from_json_str(s: String) -> PyResult<String> {
 }
 
 
+/// A Cedar `PolicySet` that is parsed once, when it is constructed, and can then be used for any number of
+/// authorization requests without parsing the policies again.
+#[pyclass(name = "PolicySet", module = "cedarpy._internal")]
+#[derive(Clone)]
+struct ParsedPolicySet {
+    policy_set: Arc<PolicySet>,
+}
+
+#[pymethods]
+impl ParsedPolicySet {
+    #[new]
+    #[pyo3(signature = (policies))]
+    fn new(policies: String) -> PyResult<Self> {
+        match PolicySet::from_str(&policies) {
+            Ok(policy_set) => Ok(Self { policy_set: Arc::new(policy_set) }),
+            Err(e) => Err(pyo3::exceptions::PyValueError::new_err(e.to_string())),
+        }
+    }
+
+    fn __str__(&self) -> String {
+        self.policy_set.to_string()
+    }
+
+    /// Make a `PolicySet` of the policies that may apply to requests for `action`, i.e. all but the policies whose
+    /// scope requires a different action.  Policy ids are preserved, so results match those of the full set.
+    fn slice_for_action(&self, action: String) -> PyResult<Self> {
+        let action: EntityUid = match action.parse() {
+            Ok(action) => action,
+            Err(e) => return Err(pyo3::exceptions::PyValueError::new_err(e.to_string())),
+        };
+
+        // template-linked policies can't be added to a new set on their own, so don't slice when there are templates
+        if self.policy_set.templates().next().is_some() {
+            return Ok(self.clone());
+        }
+
+        let mut sliced = PolicySet::new();
+        for policy in self.policy_set.policies() {
+            let may_apply = match policy.action_constraint() {
+                ActionConstraint::Eq(policy_action) => policy_action == action,
+                // `in` constraints depend on the action hierarchy, so keep them along with unconstrained policies
+                _ => true,
+            };
+            if may_apply {
+                if let Err(e) = sliced.add(policy.clone()) {
+                    return Err(pyo3::exceptions::PyValueError::new_err(e.to_string()));
+                }
+            }
+        }
+        Ok(Self { policy_set: Arc::new(sliced) })
+    }
+}
+
+/// Cedar `Entities` that are loaded once, when they are constructed, and can then be used for any number of
+/// authorization requests without parsing the entities again.  When a schema is provided, the entities are
+/// validated against it and its action entities are included, so they may only be used with that schema.
+#[pyclass(name = "Entities", module = "cedarpy._internal")]
+#[derive(Clone)]
+struct LoadedEntities {
+    entities: Arc<Entities>,
+    /// The (trimmed) source of the schema the entities were loaded with, if any
+    schema_src: Option<String>,
+}
+
+#[pymethods]
+impl LoadedEntities {
+    #[new]
+    #[pyo3(signature = (entities, schema = None))]
+    fn new(entities: String, schema: Option<String>) -> PyResult<Self> {
+        // unlike authorization, which reports an invalid schema in verbose output only, loading fails on one
+        let schema_src: Option<String> = schema.as_deref().map(str::trim)
+            .filter(|schema_src| !schema_src.is_empty())
+            .map(String::from);
+        let schema: Option<Arc<Schema>> = match schema_src.as_deref() {
+            None => None,
+            Some(schema_src) => match get_or_parse_schema(schema_src) {
+                Ok(schema) => Some(schema),
+                Err(err_message) => return Err(pyo3::exceptions::PyValueError::new_err(err_message)),
+            },
+        };
+        match load_entities(&entities, schema.as_deref()) {
+            Ok(entities) => Ok(Self { entities: Arc::new(entities), schema_src }),
+            Err(e) => Err(pyo3::exceptions::PyValueError::new_err(format!("{:#}", e))),
+        }
+    }
+
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+}
+
+impl LoadedEntities {
+    fn len(&self) -> usize {
+        self.entities.iter().count()
+    }
+
+    /// Whether the entities were loaded with the schema parsed from `schema_src`
+    fn loaded_with_schema(&self, schema_src: &str) -> bool {
+        self.schema_src.as_deref() == Some(schema_src)
+    }
+}
+
+/// Policies passed from Python as a str containing Cedar policies or as a `PolicySet` parsed in advance.
+#[derive(FromPyObject)]
+enum PoliciesArg {
+    Parsed(ParsedPolicySet),
+    Text(String),
+}
+
+/// Entities passed from Python as `Entities` loaded in advance, a JSON-formatted str, or UTF-8 encoded JSON bytes.
+/// Bytes are read in place, without copying them into a Rust `String`.
+#[derive(FromPyObject)]
+enum EntitiesArg<'a> {
+    Loaded(LoadedEntities),
+    Json(String),
+    JsonBytes(&'a [u8]),
+}
+
+impl EntitiesArg<'_> {
+    fn as_json_str(&self) -> Result<&str> {
+        match self {
+            EntitiesArg::Loaded(_) => Err(Error::msg("entities were loaded in advance and have no JSON source")),
+            EntitiesArg::Json(entities_str) => Ok(entities_str.as_str()),
+            EntitiesArg::JsonBytes(entities_bytes) => std::str::from_utf8(entities_bytes)
+                .context("failed to decode entities bytes as UTF-8"),
+        }
+    }
+}
+
 pub struct RequestArgs {
     /// Principal for the request, e.g., User::"alice"
     pub principal: String,
@@ -71,7 +203,14 @@ pub struct RequestArgs {
     pub correlation_id: Option<String>,
 }
 
+/// The parts of a request that determine its authorization result, i.e. all but the correlation id
+type RequestKey<'a> = (&'a str, &'a str, &'a str, Option<&'a str>);
+
 impl RequestArgs {
+    fn key(&self) -> RequestKey {
+        (self.principal.as_str(), self.action.as_str(), self.resource.as_str(), self.context_json.as_deref())
+    }
+
     /// Turn this `RequestArgs` into the appropriate `Request` object
     fn get_request(&self, schema: Option<&Schema>) -> Result<Request> {
         let principal: EntityUid = self.principal.parse().context(format!("Failed to parse principal as entity Uid"))?;
@@ -91,110 +230,270 @@ impl RequestArgs {
 
 #[pyfunction]
 #[pyo3(signature = (request, policies, entities, schema = None, verbose = false,))]
-fn is_authorized(request: HashMap<String, String>,
-                 policies: String,
-                 entities: String,
+fn is_authorized(py: Python<'_>,
+                 request: HashMap<String, String>,
+                 policies: PoliciesArg,
+                 entities: EntitiesArg,
                  schema: Option<String>,
                  verbose: Option<bool>)
                  -> String {
-    is_authorized_batch(vec![request], policies, entities, schema, verbose)[0].clone()
+    is_authorized_batch(py, vec![request], policies, entities, schema, verbose, false)[0].clone()
 }
 
 #[pyfunction]
-#[pyo3(signature = (requests, policies, entities, schema = None, verbose = false,))]
-fn is_authorized_batch(requests: Vec<HashMap<String, String>>,
-                       policies: String,
-                       entities: String,
+#[pyo3(signature = (requests, policies, entities, schema = None, verbose = false, parallel = false,))]
+fn is_authorized_batch(py: Python<'_>,
+                       requests: Vec<HashMap<String, String>>,
+                       policies: PoliciesArg,
+                       entities: EntitiesArg,
                        schema: Option<String>,
-                       verbose: Option<bool>)
+                       verbose: Option<bool>,
+                       parallel: bool)
                        -> Vec<String> {
+    // build a list of RequestArgs
+    let request_args_vec: Vec<RequestArgs> = requests.iter().map(to_request_args).collect();
+
+    // arguments are owned Rust values now, so evaluate without holding the GIL
+    py.allow_threads(|| authorize_batch(request_args_vec, policies, entities, schema, verbose, parallel))
+}
+
+/// Evaluate a batch of requests that was serialized into a single JSON array, e.g. by `cedarpy.pack_requests`.
+/// Unlike `is_authorized_batch`, this does not walk a Python dict per request.
+#[pyfunction]
+#[pyo3(signature = (requests, policies, entities, schema = None, verbose = false, parallel = false,))]
+fn is_authorized_batch_packed(py: Python<'_>,
+                              requests: &[u8],
+                              policies: PoliciesArg,
+                              entities: EntitiesArg,
+                              schema: Option<String>,
+                              verbose: Option<bool>,
+                              parallel: bool)
+                              -> PyResult<Vec<String>> {
+    // the packed requests are immutable bytes, so they can be read without holding the GIL
+    py.allow_threads(|| {
+        let request_args_vec: Vec<RequestArgs> = match serde_json::from_slice::<Vec<RequestJsonObject>>(requests) {
+            Ok(requests) => requests.into_iter().map(|request| RequestArgs::from(request.0)).collect(),
+            Err(e) => {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    format!("failed to parse packed requests: {}", e)))
+            }
+        };
+        Ok(authorize_batch(request_args_vec, policies, entities, schema, verbose, parallel))
+    })
+}
+
+/// Evaluate a single request that was serialized as a JSON object, e.g. with `json.dumps(request).encode()`.
+#[pyfunction]
+#[pyo3(signature = (request, policies, entities, schema = None, verbose = false,))]
+fn is_authorized_packed(py: Python<'_>,
+                        request: &[u8],
+                        policies: PoliciesArg,
+                        entities: EntitiesArg,
+                        schema: Option<String>,
+                        verbose: Option<bool>)
+                        -> PyResult<String> {
+    py.allow_threads(|| {
+        let request_args: RequestArgs = match serde_json::from_slice::<RequestJsonObject>(request) {
+            Ok(request) => RequestArgs::from(request.0),
+            Err(e) => {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    format!("failed to parse packed request: {}", e)))
+            }
+        };
+        Ok(authorize_batch(vec![request_args], policies, entities, schema, verbose, false).remove(0))
+    })
+}
+
+fn authorize_batch(request_args_vec: Vec<RequestArgs>,
+                   policies: PoliciesArg,
+                   entities: EntitiesArg,
+                   schema: Option<String>,
+                   verbose: Option<bool>,
+                   parallel: bool)
+                   -> Vec<String> {
     // CLI AuthorizeArgs: https://github.com/cedar-policy/cedar/blob/main/cedar-policy-cli/src/lib.rs#L183
     let verbose = verbose.unwrap_or(false);
     if verbose {
         //println!("requests: {}", requests);
-        println!("policies: {}", policies);
-        println!("entities: {}", entities);
+        match &policies {
+            PoliciesArg::Text(policies) => println!("policies: {}", policies),
+            PoliciesArg::Parsed(parsed) => println!("policies: {}", parsed.policy_set),
+        }
+        match &entities {
+            EntitiesArg::Loaded(loaded) => println!("entities: {} loaded entities", loaded.len()),
+            _ => println!("entities: {}", entities.as_json_str().unwrap_or("<invalid UTF-8>")),
+        }
         println!("schema: {}", schema.clone().unwrap_or(String::from("<none>")));
     }
     let mut errs: Vec<Error> = vec![];
 
-    // probably need to deconstruct execute_authorization_request so that we can reuse the
-    // expensive parts (policies, entities, schema):
-    // parse policies
+    // parse policies, reusing the PolicySet parsed in advance or by a previous call with the same policies
     let t_parse_policies = Instant::now();
-    let policy_set = match PolicySet::from_str(&policies) {
-        Ok(pset) => pset,
-        Err(parse_errors) => {
-            let err_message = format!("policy parse errors:\n{:#}",
-                                      parse_errors.to_string());
-            println!("{:#}", err_message);
-            errs.push(Error::msg(err_message));
-            PolicySet::new()
-        }
+    let policy_set = match policies {
+        PoliciesArg::Parsed(parsed) => parsed.policy_set,
+        PoliciesArg::Text(policies) => match policy_set_cache().get_or_parse(&policies, PolicySet::from_str) {
+            Ok(pset) => pset,
+            Err(parse_errors) => {
+                let err_message = format!("policy parse errors:\n{:#}",
+                                          parse_errors.to_string());
+                println!("{:#}", err_message);
+                errs.push(Error::msg(err_message));
+                Arc::new(PolicySet::new())
+            }
+        },
     };
     let t_parse_policies_duration = t_parse_policies.elapsed();
 
     // parse schema
     let t_start_schema = Instant::now();
+    let schema_src: Option<&str> = schema.as_deref().map(str::trim).filter(|schema_src| !schema_src.is_empty());
     let schema = make_schema(&schema, verbose);
     let t_parse_schema_duration = t_start_schema.elapsed();
 
-    // load entities
+    // load entities, reusing the Entities loaded in advance
     let t_load_entities = Instant::now();
-    let entities = make_entities(entities, &schema, &mut errs);
+    let entities: Arc<Entities> = match entities {
+        EntitiesArg::Loaded(loaded) => {
+            // entities are checked against a schema and gain its action entities when they are loaded, so entities
+            // loaded without this schema would not be evaluated as they would be if passed as JSON with it
+            if let Some(schema_src) = schema_src {
+                if !loaded.loaded_with_schema(schema_src) {
+                    errs.push(Error::msg("entities were not loaded with the schema given for authorization; \
+                                          load the entities with the same schema"));
+                }
+            }
+            loaded.entities
+        }
+        _ => match entities.as_json_str() {
+            Ok(entities_str) => Arc::new(make_entities(entities_str, schema.as_deref(), &mut errs)),
+            Err(e) => {
+                errs.push(e);
+                Arc::new(Entities::empty())
+            }
+        },
+    };
     let t_load_entities_duration = t_load_entities.elapsed();
 
-    // build a list of RequestArgs
-    let mut request_args_vec: Vec<RequestArgs> = Vec::new();
-    requests.iter().for_each(|request: &HashMap<String, String>| {
-        request_args_vec.push(to_request_args(request));
-    });
-
-    let mut responses_vec: Vec<String> = Vec::new();
-
-    // evaluate access one at a time (future work: eval in parallel)
-    for request_args in request_args_vec.iter() {
-        if errs.is_empty() {
-            let ans = execute_authorization_request(&request_args,
-                                                    &policy_set,
-                                                    &entities,
-                                                    &schema,
-                                                    verbose);
-            let response_string: String = match ans {
-                Ok(mut ans) => {
-                    ans.metrics.insert(String::from("parse_policies_duration_micros"),
-                                       t_parse_policies_duration.as_micros());
-                    ans.metrics.insert(String::from("parse_schema_duration_micros"),
-                                       t_parse_schema_duration.as_micros());
-                    ans.metrics.insert(String::from("load_entities_duration_micros"),
-                                       t_load_entities_duration.as_micros());
-
-                    let to_json_str_result = serde_json::to_string(&ans);
-                    match to_json_str_result {
-                        Ok(json_str) => { json_str }
-                        Err(err) => {
-                            println!("{:#}", err);
-                            make_authz_result_for_errors(&vec![Error::from(err)])
-                        }
-                    }
+    // identical requests (ignoring correlation_id) have identical results, so evaluate each distinct request once
+    let mut distinct_requests: Vec<&RequestArgs> = Vec::new();
+    let mut distinct_index_by_key: HashMap<RequestKey, usize> = HashMap::with_capacity(request_args_vec.len());
+    let response_indexes: Vec<usize> = request_args_vec.iter().map(|request_args| {
+        *distinct_index_by_key.entry(request_args.key()).or_insert_with(|| {
+            distinct_requests.push(request_args);
+            distinct_requests.len() - 1
+        })
+    }).collect();
+
+    // evaluate each distinct request independently, in parallel on rayon's thread pool when requested
+    let evaluate = |request_args: &RequestArgs| -> Result<AuthzResponse, String> {
+        if !errs.is_empty() {
+            return Err(make_authz_result_for_errors(&errs));
+        }
+
+        let ans = execute_authorization_request(request_args,
+                                                &policy_set,
+                                                &entities,
+                                                schema.as_deref(),
+                                                verbose);
+        match ans {
+            Ok(mut ans) => {
+                ans.metrics.insert(String::from("parse_policies_duration_micros"),
+                                   t_parse_policies_duration.as_micros());
+                ans.metrics.insert(String::from("parse_schema_duration_micros"),
+                                   t_parse_schema_duration.as_micros());
+                ans.metrics.insert(String::from("load_entities_duration_micros"),
+                                   t_load_entities_duration.as_micros());
+                Ok(ans)
+            }
+            Err(request_errs) => {
+                for err in &request_errs {
+                    println!("{:#}", err);
                 }
-                Err(errs) => {
-                    for err in &errs {
+                Err(make_authz_result_for_errors(&request_errs))
+            }
+        }
+    };
+
+    let mut distinct_responses: Vec<Option<Result<AuthzResponse, String>>> = if parallel {
+        distinct_requests.into_par_iter().map(|request_args| Some(evaluate(request_args))).collect()
+    } else {
+        distinct_requests.into_iter().map(|request_args| Some(evaluate(request_args))).collect()
+    };
+
+    // move each response out on its last use, so only the responses of duplicate requests are cloned
+    let mut uses_left: Vec<usize> = vec![0; distinct_responses.len()];
+    for &response_index in &response_indexes {
+        uses_left[response_index] += 1;
+    }
+
+    request_args_vec.iter().zip(response_indexes).map(|(request_args, response_index)| {
+        uses_left[response_index] -= 1;
+        let response = if uses_left[response_index] == 0 {
+            distinct_responses[response_index].take()
+        } else {
+            distinct_responses[response_index].clone()
+        };
+        match response.expect("each response is taken on its last use only") {
+            Ok(mut ans) => {
+                ans.correlation_id = request_args.correlation_id.clone();
+
+                let to_json_str_result = serde_json::to_string(&ans);
+                match to_json_str_result {
+                    Ok(json_str) => { json_str }
+                    Err(err) => {
                         println!("{:#}", err);
+                        make_authz_result_for_errors(&vec![Error::from(err)])
                     }
-                    make_authz_result_for_errors(&errs)
                 }
-            };
-            responses_vec.push(response_string);
-        } else {
-            responses_vec.push(make_authz_result_for_errors(&errs))
+            }
+            Err(response_string) => response_string,
+        }
+    }).collect()
+}
+
+/// Maximum number of distinct sources held by each `ParseCache`
+const PARSE_CACHE_CAPACITY: usize = 16;
+
+/// A cache of parsed Cedar objects keyed by the source text they were parsed from.
+/// Applications typically authorize many requests against the same policies and schema, so caching lets
+/// repeated calls skip parsing.  The cache is cleared when it is full rather than evicting individual entries.
+struct ParseCache<T> {
+    entries: Mutex<HashMap<String, Arc<T>>>,
+}
+
+impl<T> ParseCache<T> {
+    fn new() -> Self {
+        Self { entries: Mutex::new(HashMap::new()) }
+    }
+
+    /// Get the object parsed from `src`, parsing it with `parse` when it is not cached.
+    /// Parse errors are returned to the caller and are not cached.
+    fn get_or_parse<E>(&self, src: &str, parse: impl FnOnce(&str) -> Result<T, E>) -> Result<Arc<T>, E> {
+        if let Some(parsed) = self.entries.lock().unwrap().get(src) {
+            return Ok(Arc::clone(parsed));
         }
 
+        let parsed = Arc::new(parse(src)?);
+        let mut entries = self.entries.lock().unwrap();
+        if entries.len() >= PARSE_CACHE_CAPACITY {
+            entries.clear();
+        }
+        entries.insert(src.to_string(), Arc::clone(&parsed));
+        Ok(parsed)
     }
+}
+
+fn policy_set_cache() -> &'static ParseCache<PolicySet> {
+    static POLICY_SET_CACHE: OnceLock<ParseCache<PolicySet>> = OnceLock::new();
+    POLICY_SET_CACHE.get_or_init(ParseCache::new)
+}
 
-    return responses_vec;
+fn schema_cache() -> &'static ParseCache<Schema> {
+    static SCHEMA_CACHE: OnceLock<ParseCache<Schema>> = OnceLock::new();
+    SCHEMA_CACHE.get_or_init(ParseCache::new)
 }
 
+
 fn make_authz_result_for_errors(errs: &Vec<Error>) -> String {
     let json_obj = json!(
         {
@@ -233,6 +532,61 @@ fn to_request_args(request: &HashMap<String, String>) -> RequestArgs {
     }
 }
 
+/// A request as serialized in a packed batch of requests.
+/// The context may be a JSON object or a string containing a JSON object.
+#[derive(Debug, Deserialize)]
+struct RequestJson {
+    principal: String,
+    action: String,
+    resource: String,
+    #[serde(default)]
+    context: Option<serde_json::Value>,
+    #[serde(default)]
+    correlation_id: Option<String>,
+}
+
+/// A `RequestJson` that was serialized as a JSON object.  Derived struct deserializers also accept an array of the
+/// field values in order, which is not a valid request.
+struct RequestJsonObject(RequestJson);
+
+impl<'de> Deserialize<'de> for RequestJsonObject {
+    fn deserialize<D: de::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct RequestJsonObjectVisitor;
+
+        impl<'de> de::Visitor<'de> for RequestJsonObjectVisitor {
+            type Value = RequestJsonObject;
+
+            fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+                formatter.write_str("a request object")
+            }
+
+            fn visit_map<A: de::MapAccess<'de>>(self, map: A) -> Result<Self::Value, A::Error> {
+                RequestJson::deserialize(de::value::MapAccessDeserializer::new(map)).map(RequestJsonObject)
+            }
+        }
+
+        deserializer.deserialize_map(RequestJsonObjectVisitor)
+    }
+}
+
+impl From<RequestJson> for RequestArgs {
+    fn from(request: RequestJson) -> Self {
+        let context_json: Option<String> = match request.context {
+            None | Some(serde_json::Value::Null) => None, // context member not present
+            Some(serde_json::Value::String(context)) => Some(context),
+            Some(context) => Some(context.to_string()),
+        };
+
+        RequestArgs {
+            principal: request.principal,
+            action: request.action,
+            resource: request.resource,
+            context_json,
+            correlation_id: request.correlation_id,
+        }
+    }
+}
+
 #[derive(Debug, PartialEq, Eq, Clone, Serialize, Deserialize)]
 pub struct DiagnosticsSer {
     /// `PolicyId`s of the policies that contributed to the decision.
@@ -293,14 +647,14 @@ fn execute_authorization_request(
     request_args: &RequestArgs,
     policy_set: &PolicySet,
     entities: &Entities,
-    schema: &Option<Schema>,
+    schema: Option<&Schema>,
     verbose: bool
 ) -> Result<AuthzResponse, Vec<Error>> {
     let mut errs: Vec<Error> = vec![];
     let t_build_request = Instant::now();
 
     // may want to create request in calling method; then we could get relocate errs
-    let request = match request_args.get_request(schema.as_ref()) {
+    let request = match request_args.get_request(schema) {
         Ok(q) => Some(q),
         Err(e) => {
             errs.push(e.context("failed to parse schema from request"));
@@ -328,8 +682,8 @@ fn execute_authorization_request(
     }
 }
 
-fn make_entities(entities_str: String, schema: &Option<Schema>, errs: &mut Vec<Error>) -> Entities {
-    match load_entities(entities_str, schema.as_ref()) {
+fn make_entities(entities_str: &str, schema: Option<&Schema>, errs: &mut Vec<Error>) -> Entities {
+    match load_entities(entities_str, schema) {
         Ok(entities) => entities,
         Err(e) => {
             errs.push(e);
@@ -338,8 +692,8 @@ fn make_entities(entities_str: String, schema: &Option<Schema>, errs: &mut Vec<E
     }
 }
 
-fn make_schema(schema_str: &Option<String>, verbose: bool) -> Option<Schema> {
-    let schema: Option<Schema> = match &schema_str {
+fn make_schema(schema_str: &Option<String>, verbose: bool) -> Option<Arc<Schema>> {
+    let schema: Option<Arc<Schema>> = match &schema_str {
         None => None,
         Some(schema_src) => {
             if verbose {
@@ -352,35 +706,36 @@ fn make_schema(schema_str: &Option<String>, verbose: bool) -> Option<Schema> {
                 return None;
             }
 
-            if trimmed_schema_src.starts_with('{') {
-                match Schema::from_json_str(trimmed_schema_src) {
-                    Ok(schema) => Some(schema),
-                    Err(json_err) => {
-                        if verbose {
-                            println!("!!! could not construct schema from JSON: {}", json_err);
-                        }
-                        None
-                    }
-                }
-            } else {
-                match Schema::from_str(trimmed_schema_src) {
-                    Ok(schema) => Some(schema),
-                    Err(str_err) => {
-                        if verbose {
-                            println!("!!! could not construct schema from str: {}", str_err);
-                        }
-                        None
+            match get_or_parse_schema(trimmed_schema_src) {
+                Ok(schema) => Some(schema),
+                Err(err_message) => {
+                    if verbose {
+                        println!("!!! {}", err_message);
                     }
+                    None
                 }
             }
         }
-    };    
+    };
     schema
 }
 
+/// Parse a schema in JSON or Cedar format, reusing the schema parsed from the same source by a previous call
+fn get_or_parse_schema(schema_src: &str) -> Result<Arc<Schema>, String> {
+    schema_cache().get_or_parse(schema_src, |src| {
+        if src.starts_with('{') {
+            Schema::from_json_str(src)
+                .map_err(|json_err| format!("could not construct schema from JSON: {}", json_err))
+        } else {
+            Schema::from_str(src)
+                .map_err(|str_err| format!("could not construct schema from str: {}", str_err))
+        }
+    })
+}
+
 /// Load an `Entities` object from the given JSON string and optional schema.
-fn load_entities(entities_str: String, schema: Option<&Schema>) -> Result<Entities> {
-    return Entities::from_json_str(&entities_str, schema).context(format!(
+fn load_entities(entities_str: &str, schema: Option<&Schema>) -> Result<Entities> {
+    return Entities::from_json_str(entities_str, schema).context(format!(
         "failed to parse entities from:\n{}", entities_str)
     );
 }
@@ -391,8 +746,12 @@ fn _internal(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(echo, m)?)?;
     m.add_function(wrap_pyfunction!(is_authorized, m)?)?;
     m.add_function(wrap_pyfunction!(is_authorized_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(is_authorized_batch_packed, m)?)?;
+    m.add_function(wrap_pyfunction!(is_authorized_packed, m)?)?;
     m.add_function(wrap_pyfunction!(format_policies, m)?)?;
     m.add_function(wrap_pyfunction!(policies_to_json_str, m)?)?;
     m.add_function(wrap_pyfunction!(policies_from_json_str, m)?)?;
+    m.add_class::<ParsedPolicySet>()?;
+    m.add_class::<LoadedEntities>()?;
     Ok(())
 }
\ No newline at end of file
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 import pprint
@@ -21,7 +22,9 @@ def load_file_as_json(relative_file_path: str, base_file=__file__) -> Union[obje
         raise
 
 
+@functools.cache
 def load_file_as_str(relative_file_path: str, base_file=__file__) -> str:
+    # test resources are not modified during a test run, e.g. the integration test suites share policies & schemas
     path = construct_path_relative_to_current_module(relative_file_path, base_file)
 
     try:
@@ -1,6 +1,11 @@
-import datetime
+import json
 from typing import Union
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 
 def load_file_as_json(relative_file_path: str) -> Union[object, list, dict]:
     import shared
@@ -14,8 +19,15 @@ def load_file_as_str(relative_file_path: str) -> str:
                                    base_file=__file__)
 
 
-def utc_now() -> datetime.datetime:
-    """
-    Get the current time in UTC.
-    """
-    return datetime.datetime.now(datetime.timezone.utc)
+def to_json_str(obj: object) -> str:
+    """Serialize an object to a json-formatted str, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def to_json_bytes(obj: object) -> bytes:
+    """Serialize an object to UTF-8 encoded json, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
@@ -1,23 +1,27 @@
 import unittest
+from types import MappingProxyType
 
 from cedarpy import AuthzResult, Decision, Diagnostics
 
 
 class AuthzResultTestCase(unittest.TestCase):
 
-    def setUp(self) -> None:
-        super().setUp()
+    SUBSCRIPTABLE_PROPERTY_NAMES = ('decision', 'allowed', 'diagnostics', 'metrics')
 
-        self.allow_authz_resp = {
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # fixtures are shared by all tests in the class, so they are read-only
+        cls.allow_authz_resp = MappingProxyType({
             "decision": "Allow",
             "diagnostics": {
                 "reason": ["policy0"],
                 "errors": []
             },
             "metrics": {"authz_duration_micros": 42}
-        }
+        })
 
-        self.deny_authz_resp = {
+        cls.deny_authz_resp = MappingProxyType({
             'decision': 'Deny',
             'diagnostics': {
                 'errors': ['while evaluating policy policy2, encountered the '
@@ -26,7 +30,9 @@ class AuthzResultTestCase(unittest.TestCase):
                 'reason': []
             },
             "metrics": {"authz_duration_micros": 99}
-        }
+        })
+
+        cls.authz_resps = (cls.allow_authz_resp, cls.deny_authz_resp)
 
     def test_decision_property_when_Allow(self):
         authz_result = AuthzResult(self.allow_authz_resp)
@@ -41,21 +47,28 @@ class AuthzResultTestCase(unittest.TestCase):
         self.assertEqual(Decision.Deny, authz_result['decision'])
         self.assertFalse(authz_result.allowed)
 
+    def test_decision_property_when_missing_is_None(self):
+        authz_result = AuthzResult({"diagnostics": {"reason": [], "errors": []}})
+        self.assertIsNone(authz_result.decision)
+        self.assertFalse(authz_result.allowed)
+
+    def test_unknown_decision_raises_on_construction(self):
+        with self.assertRaises(KeyError):
+            AuthzResult({"decision": "Maybe"})
+
     def test_diagnostics_are_available(self):
-        for authz_resp in [
-            self.allow_authz_resp,
-            self.deny_authz_resp,
-        ]:
-            authz_result = AuthzResult(authz_resp)
-            self.assertIsNotNone(authz_result.diagnostics)
+        for authz_resp in self.authz_resps:
+            with self.subTest(decision=authz_resp['decision']):
+                authz_result = AuthzResult(authz_resp)
+                self.assertIsNotNone(authz_result.diagnostics)
 
-            self.assertEqual(authz_resp['diagnostics']['errors'],
-                             authz_result.diagnostics.errors)
+                self.assertEqual(authz_resp['diagnostics']['errors'],
+                                 authz_result.diagnostics.errors)
 
-            self.assertEqual(authz_resp['diagnostics']['reason'],
-                             authz_result.diagnostics.reasons,
-                             f"expected 'reason' key (singular) to be mapped to reasons property (plural)"
-                             f"; authz_resp: {authz_resp}")
+                self.assertEqual(authz_resp['diagnostics']['reason'],
+                                 authz_result.diagnostics.reasons,
+                                 f"expected 'reason' key (singular) to be mapped to reasons property (plural)"
+                                 f"; authz_resp: {authz_resp}")
 
     def test_metrics_are_available(self):
         missing_metrics = {}
@@ -79,43 +92,57 @@ class AuthzResultTestCase(unittest.TestCase):
                 self.assertEqual({}, authz_result.metrics)
 
     def test__getitem__makes_properties_subscriptable(self):
-        for authz_resp in [
-            self.allow_authz_resp,
-            self.deny_authz_resp,
-        ]:
-            authz_result = AuthzResult(authz_resp)
-            
-            self.assertEqual(authz_result.decision, authz_result['decision'])
-            self.assertEqual(authz_result.allowed, authz_result['allowed'])
-            self.assertEqual(authz_result.diagnostics, authz_result['diagnostics'])
-            self.assertEqual(authz_result.metrics, authz_result['metrics'])
+        for authz_resp in self.authz_resps:
+            with self.subTest(decision=authz_resp['decision']):
+                authz_result = AuthzResult(authz_resp)
 
+                for property_name in self.SUBSCRIPTABLE_PROPERTY_NAMES:
+                    self.assertEqual(getattr(authz_result, property_name), authz_result[property_name],
+                                     msg=f"expected {property_name} to be available via subscript")
 
-class DiagnosticsTestCase(unittest.TestCase):
+    def test_equality_compares_decision_and_diagnostics(self):
+        allow_authz_result = AuthzResult(self.allow_authz_resp)
+        self.assertEqual(allow_authz_result,
+                         AuthzResult(dict(self.allow_authz_resp, correlation_id="abc", metrics={})),
+                         msg="correlation_id and metrics should not be compared")
+        self.assertEqual(hash(allow_authz_result),
+                         hash(AuthzResult(dict(self.allow_authz_resp, correlation_id="abc"))))
+        self.assertEqual(AuthzResult({"decision": "Allow", "diagnostics": {"reason": ["policy0", "policy1"]}}),
+                         AuthzResult({"decision": "Allow", "diagnostics": {"reason": ["policy1", "policy0"]}}),
+                         msg="reasons should be compared without regard to order")
+
+        self.assertNotEqual(allow_authz_result, AuthzResult(self.deny_authz_resp))
+        self.assertNotEqual(allow_authz_result, self.allow_authz_resp)
 
-    def setUp(self) -> None:
-        super().setUp()
 
-        self.allow_diagnostics_resp = {
+class DiagnosticsTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # fixtures are shared by all tests in the class, so they are read-only
+        cls.allow_diagnostics_resp = MappingProxyType({
             "errors": [],
             "reason": ["policy0"],
-        }
+        })
 
-        self.deny_diagnostics_resp = {
+        cls.deny_diagnostics_resp = MappingProxyType({
             'errors': ['while evaluating policy policy2, encountered the '
                        'following error: record does not have the '
                        'required attribute: authenticated'],
             'reason': [],
-        }
+        })
+
+        cls.diagnostics_resps = (cls.allow_diagnostics_resp, cls.deny_diagnostics_resp)
 
     def test_errors_are_resolved(self):
-        for diagnostics_resp in [self.allow_diagnostics_resp, self.deny_diagnostics_resp]:
+        for diagnostics_resp in self.diagnostics_resps:
             diagnostics = Diagnostics(diagnostics_resp)
             self.assertEqual(diagnostics_resp['errors'],
                              diagnostics.errors)
 
     def test_reasons_are_resolved(self):
-        for diagnostics_resp in [self.allow_diagnostics_resp, self.deny_diagnostics_resp]:
+        for diagnostics_resp in self.diagnostics_resps:
             diagnostics = Diagnostics(diagnostics_resp)
             self.assertEqual(diagnostics_resp['reason'],
                              diagnostics.reasons)
@@ -1,5 +1,6 @@
 import unittest
 
+from pathlib import Path
 from textwrap import dedent
 
 from cedarpy import format_policies, policies_from_json_str, policies_to_json_str
@@ -8,70 +9,67 @@ from unit import load_file_as_str
 
 import json
 
-class FormatPolicyTestCase(unittest.TestCase):
-    def setUp(self) -> None:
-        super().setUp()
+# policies are dedented once, when the module is loaded
+FORMAT_INPUT_POLICY: str = dedent("""
+    permit(
+        principal,
+        action == Action::"edit",
+        resource
+    )
+    when {
+        resource.owner == principal
+    };
+""").strip()
 
-    def test_policy_gets_formatted(self):
-        input_policy = dedent("""
-            permit(
-                principal,
-                action == Action::"edit",
-                resource
-            )
-            when {
-                resource.owner == principal
-            };
-        """).strip()
+FORMAT_EXPECTED_POLICY: str = dedent("""
+    permit (
+      principal,
+      action == Action::"edit",
+      resource
+    )
+    when { resource.owner == principal };
+""").lstrip()
 
-        expect_result = dedent("""
-            permit (
-              principal,
-              action == Action::"edit",
-              resource
-            )
-            when { resource.owner == principal };
-        """).lstrip()
+FORMAT_INVALID_POLICY: str = dedent("""
+    invalid(
+        principal,
+        action == Action::"edit",
+        resource
+    )
+    when {
+        resource.owner == principal
+    };
+""").strip()
 
-        actual_result = format_policies(input_policy, indent_width=2)
 
-        self.assertEqual(expect_result, actual_result)
+class FormatPolicyTestCase(unittest.TestCase):
 
-    def test_policy_formatting_error(self):
-        input_policy = dedent("""
-            invalid(
-                principal,
-                action == Action::"edit",
-                resource
-            )
-            when {
-                resource.owner == principal
-            };
-        """).strip()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        # conversion order in rust cedar library is non deterministic so bob's policies could be one of n! variants;
+        # good thing bob only has three policies!!!
+        bob_policy_paths = sorted(Path(__file__).parent.glob("resources/json/bob_policy*.cedar"))
+        cls.bob_policy_variants = [load_file_as_str(f"resources/json/{path.name}") for path in bob_policy_paths]
+        cls.bob_policy_json = json.loads(load_file_as_str("resources/json/bob_policy.json"))
 
+    def test_policy_gets_formatted(self):
+        actual_result = format_policies(FORMAT_INPUT_POLICY, indent_width=2)
+
+        self.assertEqual(FORMAT_EXPECTED_POLICY, actual_result)
+
+    def test_policy_formatting_error(self):
         try:
-            format_policies(input_policy, indent_width=2)
+            format_policies(FORMAT_INVALID_POLICY, indent_width=2)
             self.fail("should have failed to parse")
         except ValueError as e:
             pass
 
     def test_policy_to_json(self):
         result: dict = json.loads(policies_to_json_str(load_file_as_str("resources/json/bob_policy1.cedar")))
-        expected: dict = json.loads(load_file_as_str("resources/json/bob_policy.json"))
-        self.assertEqual(expected, result, msg='expected cedar to be parsed to json correctly')
+        self.assertEqual(self.bob_policy_json, result, msg='expected cedar to be parsed to json correctly')
 
     def test_policy_from_json(self):
         json_str = load_file_as_str("resources/json/bob_policy.json")
-        # this is required as conversion order in rust cedar library is non deterministic so could be one of n! variants
-        # good thing bob only has three policies!!!
-        expected = [
-            load_file_as_str("resources/json/bob_policy1.cedar"),
-            load_file_as_str("resources/json/bob_policy2.cedar"),
-            load_file_as_str("resources/json/bob_policy3.cedar"),
-            load_file_as_str("resources/json/bob_policy4.cedar"),
-            load_file_as_str("resources/json/bob_policy5.cedar"),
-            load_file_as_str("resources/json/bob_policy6.cedar"),
-        ]
         result = format_policies(policies_from_json_str(json_str))
-        self.assertIn(result, expected, msg='expected json to be parsed to cedar correctly')
-
+        self.assertIn(result, self.bob_policy_variants, msg='expected json to be parsed to cedar correctly')